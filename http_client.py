@@ -0,0 +1,56 @@
+import atexit
+from functools import lru_cache
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@lru_cache(maxsize=1)
+def get_async_client() -> httpx.AsyncClient:
+    """Shared HTTP/2 client for the async demo.
+
+    Cached so every fetch in a run — from any module — shares one
+    connection pool and its warmed-up TLS sessions instead of each
+    caller building its own client. The pool lives until
+    aclose_async_client() is awaited at the end of the run.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=10.0,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session for the sync demo."""
+    session = requests.Session()
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    )
+    return session
+
+
+async def aclose_async_client() -> None:
+    """Closes the cached async client on the loop that used it.
+
+    The pooled transports belong to the loop that made the requests, so
+    this must be awaited before that loop shuts down — closing from
+    atexit on a fresh loop raises 'Event loop is closed'. The cache is
+    cleared so the next get_async_client() hands out a fresh client.
+    """
+    if get_async_client.cache_info().currsize:
+        client = get_async_client()
+        get_async_client.cache_clear()
+        if not client.is_closed:
+            await client.aclose()
+
+
+def _close_clients() -> None:
+    # only the sync session: it has no event loop to outlive
+    if get_session.cache_info().currsize:
+        get_session().close()
+
+
+atexit.register(_close_clients)
@@ -1,35 +1,53 @@
 from __future__ import annotations
 
-import csv
-from typing import Any, Dict
+from typing import Any
+
+import pandas as pd
 
 
 class Item:
+    # fixed attribute slots: instances skip the per-object __dict__, so
+    # they are smaller and attribute access is an indexed load
+    # (private names are mangled to _Item__name / _Item__price)
+    __slots__ = ("__name", "__price", "__quantity", "_repr_cache")
+
     pay_rate: float = 0.8  # 20% discount
     all: list[Item] = []
 
-    def __init__(self, name: str, price: float, quantity: int = 0) -> None:
+    def __init__(
+        self,
+        name: str,
+        price: float,
+        quantity: int = 0,
+        _register: bool = True,
+    ) -> None:
         """initialize item
 
         Args:
             name (str): name of item
             price (float): price of item
             quantity (int, optional): quantity of item. Defaults to 0.
+            _register (bool, optional): add to Item.all. Defaults to True.
+                Bulk constructors pass False and place items themselves.
         """
 
-        # validations
-        assert price > 0.0, f"Price {price} should be greater than 0!"
-        assert (
-            quantity >= 0
-        ), f"Quantity {quantity} should be greater than or equal to 0!"
+        # validations (plain raises: asserts disappear under python -O)
+        if not price > 0.0:
+            raise ValueError(f"Price {price} should be greater than 0!")
+        if not quantity >= 0:
+            raise ValueError(
+                f"Quantity {quantity} should be greater than or equal to 0!"
+            )
 
         # assign to self object
         self.__name: str = name
         self.__price: float = price
-        self.quantity: int = quantity
+        self.__quantity: int = quantity
+        self._repr_cache: str | None = None
 
         # add to all items
-        Item.all.append(self)
+        if _register:
+            Item.all.append(self)
 
     @property
     # Property decorator = read-only attribute
@@ -40,11 +58,27 @@ class Item:
     def price(self) -> float:
         return self.__price
 
+    @property
+    def quantity(self) -> int:
+        return self.__quantity
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        # quantity shows up in the memoized repr, so the setter has to
+        # drop the cache like the name setter does
+        if not value >= 0:
+            raise ValueError(
+                f"Quantity {value} should be greater than or equal to 0!"
+            )
+        self.__quantity = value
+        self._repr_cache = None
+
     @name.setter
     def name(self, value: str) -> None:
         # length b/w 1 and 10
         if 1 <= len(value) <= 10:
             self.__name = value
+            self._repr_cache = None
         else:
             raise Exception("Name should be 1-10 characters!")
 
@@ -61,10 +95,34 @@ class Item:
         None
         """
         if 0.0 < increment < 1:
-            self.__price = self.__price + self.__price * increment
+            # one attribute load/store instead of three loads
+            self.__price *= 1 + increment
+            self._repr_cache = None
         else:
             raise Exception("Increment should be between 0 and 1")
 
+    @classmethod
+    def apply_increment_all(cls, increment: float) -> None:
+        """apply one increment to every registered item in a single pass
+
+        validates the increment once and hoists the multiplier out of
+        the loop, instead of paying a method call and a range check
+        per item
+
+        Args:
+        increment (float): increment value
+        range: 0.0 to 1.0
+
+        Returns:
+        None
+        """
+        if not 0.0 < increment < 1:
+            raise Exception("Increment should be between 0 and 1")
+        factor: float = 1 + increment
+        for item in cls.all:
+            item.__price *= factor
+            item._repr_cache = None
+
     # encapsulation
     def calulate_total_price(self) -> float:
         """total price of item
@@ -74,29 +132,47 @@ class Item:
         Returns:
             int: total price of item
         """
-        total_price: float = self.__price * self.quantity
+        total_price: float = self.__price * self.__quantity
         return total_price
 
-    def apply_discount(self) -> None:
+    def apply_discount(self, pay_rate: float = pay_rate) -> None:
         """apply discount to price
 
+        the default binds Item.pay_rate at class-definition time, so the
+        hot path reads a local (LOAD_FAST) instead of chasing the class
+        attribute per call; pass a rate explicitly to override
+
         Returns:
             float: discounted price
         """
-        self.__price = self.__price * self.pay_rate
+        self.__price *= pay_rate
+        self._repr_cache = None
 
     @classmethod
     def instantiate_from_csv(cls):
-        with open("items.csv", "r") as f:
-            reader: csv.DictReader = csv.DictReader(f)
-            items: list[Dict[str, str]] = list(reader)
-
-        for item in items:
-            Item(
-                name=item.get("name", ""),
-                price=float(item.get("price", 0)),
-                quantity=int(item.get("quantity", 0)),
-            )
+        # pandas parses the file in C with typed columns, so there is no
+        # per-row float()/int() conversion or intermediate list of dicts.
+        # chunksize streams the file: peak memory is one chunk, not the
+        # whole frame, while the registry still grows one block per chunk
+        chunks = pd.read_csv(
+            "items.csv",
+            dtype={"name": str, "price": float, "quantity": int},
+            chunksize=1024,
+        )
+        for chunk in chunks:
+            # build the chunk locally and publish it in one extend: if a
+            # row fails validation the raise leaves the registry exactly
+            # as it was, with no half-filled holes
+            batch: list[Item] = [
+                Item(
+                    name=row.name,
+                    price=row.price,
+                    quantity=row.quantity,
+                    _register=False,
+                )
+                for row in chunk.itertuples(index=False)
+            ]
+            cls.all.extend(batch)
 
     @staticmethod
     def is_integer(num: int | float | Any) -> bool:
@@ -143,7 +219,11 @@ class Item:
         print("email sent successfully")
 
     def __repr__(self) -> str:
-        return f"Item('{self.name}', {self.price}, {self.quantity})"
+        # memoized: dumping a large Item.all reuses the cached string,
+        # mutators reset _repr_cache to None
+        if self._repr_cache is None:
+            self._repr_cache = f"Item('{self.name}', {self.price}, {self.quantity})"  # noqa: E501
+        return self._repr_cache
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -2,6 +2,9 @@ from item import Item
 
 
 class Phone(Item):
+    # only the attributes Phone adds on top of Item's slots
+    __slots__ = ("broken_phones",)
+
     def __init__(
         self,
         name: str,
@@ -12,11 +15,15 @@ class Phone(Item):
         # call to super function to have access to all attributes / methods
         super().__init__(name, price, quantity)
 
-        assert broken_phones >= 0, f"Broken phones {broken_phones} should be >= 0!"  # noqa: E501
+        if not broken_phones >= 0:
+            raise ValueError(f"Broken phones {broken_phones} should be >= 0!")
 
         self.broken_phones: int = broken_phones
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}('{self.name}', {self.price}, {self.quantity})"  # noqa: E501
-        )
+        # literal class name: no __class__/__name__ attribute chase per
+        # call, and the built string is memoized like Item's repr
+        # (subclasses should define their own __repr__)
+        if self._repr_cache is None:
+            self._repr_cache = f"Phone('{self.name}', {self.price}, {self.quantity})"  # noqa: E501
+        return self._repr_cache